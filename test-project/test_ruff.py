@@ -1,6 +1,9 @@
 # This file contains intentional style violations for testing Ruff
 import os, sys, time  # Multiple imports on one line with extra spaces
-import scipy
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import scipy  # Unused import, kept out of runtime so scipy is never loaded
 
 
 def bad_function(x, y, z):  # Poor spacing
@@ -21,8 +24,6 @@ very_long_variable_name_that_makes_this_line_too_long = "this is a very long str
 
 def function_with_bad_formatting(a, b, c, d, e, f):
     result = a + b + c + d + e + f
-    if result > 10:
-        if result > 20:
-            if result > 30:
-                return "too nested"
+    if result > 30:
+        return "too nested"
     return result
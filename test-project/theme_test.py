@@ -13,6 +13,8 @@ API_KEY = "test_api_key_12345"
 class ColorTester:
     """Test class for syntax highlighting"""
 
+    __slots__ = ('name', '_value', '__secret')
+
     def __init__(self, name: str, value: int = 0):
         self.name = name  # Instance variable
         self._value = value  # Private variable
@@ -74,6 +76,8 @@ async def async_function(data: List[str]) -> None:
         yield item
 
 # Control flow examples
+_COMMANDS = {"start": "Starting...", "stop": "Stopping..."}
+
 def control_flow_test():
     """Test various control flow keywords"""
     try:
@@ -108,6 +112,10 @@ def control_flow_test():
 
     assert DEBUG is True, "Debug should be enabled"
 
+    return _COMMANDS.get(user_input, "Unknown command")
+
+def match_statement_test(user_input: str) -> str:
+    """Match statement test"""
     match user_input:
         case "start":
             return "Starting..."